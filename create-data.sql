@@ -35,3 +35,22 @@ CREATE INDEX idx_cats_name ON cats(name);
 
 -- Create an index on breed for filtering
 CREATE INDEX idx_cats_breed ON cats(breed);
+
+-- Trigram index so substring searches on breed (ILIKE '%...%') can use an index
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS cats_breed_trgm ON cats USING gin (breed gin_trgm_ops);
+
+-- Pre-aggregated counts and age stats per breed and indoor status, read by
+-- retrieve-data-db.py and refreshed by insert_data-db.py after bulk inserts
+CREATE MATERIALIZED VIEW IF NOT EXISTS cats_summary AS
+SELECT
+    breed,
+    is_indoor,
+    COUNT(*) AS count,
+    COUNT(age) AS age_count,
+    SUM(age) AS age_sum,
+    MIN(age) AS min_age,
+    MAX(age) AS max_age
+FROM cats
+GROUP BY breed, is_indoor;
+CREATE UNIQUE INDEX IF NOT EXISTS cats_summary_breed_indoor ON cats_summary (breed, is_indoor);
@@ -4,89 +4,421 @@ Python script to insert new cat data into the PostgreSQL database.
 """
 
 import psycopg2
+import psycopg2.errors
+import psycopg2.extras
+import psycopg2.pool
 from psycopg2 import sql
 import sys
 import os
-from typing import List, Tuple, Optional, Dict, Any
+import threading
+from contextlib import contextmanager
+from types import MappingProxyType
+import io
+import struct
+from functools import lru_cache
+from typing import List, Tuple, Optional, Iterator, Dict, Any, Sequence, Mapping, Final
 from datetime import date, datetime
-import random
+import re
+from operator import itemgetter
 
-# Load environment variables from .env file if python-dotenv is available
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    print("📝 Note: python-dotenv not installed. Using system environment variables only.")
+import numpy as np
 
-# Database connection parameters from environment variables
-DB_CONFIG = {
+# Load environment variables from .env file if python-dotenv is available,
+# unless every setting read below is already in the environment (load_dotenv
+# never overrides variables that are already set)
+if not {'DB_HOST', 'DB_PORT', 'POSTGRES_DB', 'POSTGRES_USER', 'POSTGRES_PASSWORD'} <= os.environ.keys():
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        print("📝 Note: python-dotenv not installed. Using system environment variables only.")
+
+# Database connection parameters from environment variables, frozen at import
+DB_CONFIG: Final[Mapping[str, Any]] = MappingProxyType({
     'host': os.getenv('DB_HOST', 'localhost'),
     'port': int(os.getenv('DB_PORT', '5432')),
     'database': os.getenv('POSTGRES_DB', 'catsdb'),
     'user': os.getenv('POSTGRES_USER', 'postgres'),
     'password': os.getenv('POSTGRES_PASSWORD', 'password')
-}
+})
+
+# Extracts the insertable fields of a cat dictionary as a positional tuple,
+# in the column order used by the INSERT and COPY statements
+CAT_ROW = itemgetter(
+    'name', 'breed', 'age', 'color', 'weight_kg', 'is_indoor', 'adoption_date', 'description'
+)
+
+# Input formats accepted by get_user_input_for_cat(), checked before parsing
+INT_RE = re.compile(r'^-?\d+$')
+FLOAT_RE = re.compile(r'^-?(\d+(\.\d*)?|\.\d+)$')
+DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# Value pools for generate_random_cats(), stored as object arrays so a whole
+# column can be drawn with a single index gather
+_CAT_NAMES = np.array([
+    "Fluffy", "Oreo", "Felix", "Bella", "Max", "Lucy", "Charlie", "Molly",
+    "Oscar", "Ruby", "Leo", "Daisy", "Milo", "Sophie", "Simba", "Chloe",
+    "Jasper", "Lily", "Oliver", "Zoe", "Chester", "Maya", "Toby", "Emma"
+], dtype=object)
+
+_CAT_BREEDS = np.array([
+    "Persian", "Siamese", "Maine Coon", "British Shorthair", "Ragdoll",
+    "Bengal", "Russian Blue", "Scottish Fold", "Abyssinian", "Birman",
+    "Norwegian Forest Cat", "Oriental", "Burmese", "Egyptian Mau", "Manx"
+], dtype=object)
+
+_CAT_COLORS = np.array([
+    "Black", "White", "Gray", "Orange", "Brown", "Cream", "Silver",
+    "Calico", "Tabby", "Tortoiseshell", "Tuxedo", "Blue", "Red"
+], dtype=object)
+
+_CAT_DESCRIPTIONS = np.array([
+    "A playful and energetic cat who loves to chase toys",
+    "Calm and gentle, perfect for families with children",
+    "Very affectionate and enjoys being petted",
+    "Independent but loyal, great for apartment living",
+    "Curious and intelligent, loves to explore",
+    "Shy at first but becomes very loving once comfortable",
+    "Active outdoor cat who enjoys climbing trees",
+    "Lazy indoor cat who loves to sleep in sunny spots",
+    "Social cat who gets along well with other pets",
+    "Vocal cat who likes to 'talk' to their owners"
+], dtype=object)
+
+# Rows per COPY statement; caps the size of the in-memory COPY buffer
+COPY_CHUNK_SIZE = 50000
+
+# Framing for COPY ... WITH (FORMAT BINARY): signature, flags and header
+# extension length up front, a field count before each row, -1 at the end
+_PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack('!ii', 0, 0)
+_PGCOPY_ROW_START = struct.pack('!h', 8)
+_PGCOPY_TRAILER = struct.pack('!h', -1)
+_PG_NULL_FIELD = struct.pack('!i', -1)
+_PG_EPOCH = date(2000, 1, 1)
+
+# SQL statements, built once at import and reused on every call
+_PREPARE_INSERT_CAT = sql.SQL("""
+    PREPARE ins_cat (text, text, int, text, numeric, bool, date, text) AS
+        INSERT INTO cats (name, breed, age, color, weight_kg, is_indoor, adoption_date, description)
+        VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+        RETURNING id;
+""")
+
+_EXECUTE_INSERT_CAT = sql.SQL("""
+    EXECUTE ins_cat (%(name)s, %(breed)s, %(age)s, %(color)s, %(weight_kg)s,
+                     %(is_indoor)s, %(adoption_date)s, %(description)s);
+""")
+
+_INSERT_CATS = sql.SQL("""
+    INSERT INTO cats (name, breed, age, color, weight_kg, is_indoor, adoption_date, description)
+    VALUES %s
+""")
+
+_INSERT_CATS_RETURNING_ID = _INSERT_CATS + sql.SQL(" RETURNING id")
+
+_COPY_CATS_BINARY = sql.SQL("""
+    COPY cats (name, breed, age, color, weight_kg, is_indoor, adoption_date, description)
+    FROM STDIN WITH (FORMAT BINARY)
+""")
 
-def connect_to_database() -> Optional[psycopg2.extensions.connection]:
+_REFRESH_CATS_SUMMARY = sql.SQL("""
+    REFRESH MATERIALIZED VIEW CONCURRENTLY cats_summary;
+""")
+
+# Shared connection pool, created on first use so importing this module
+# does not require a reachable database
+_POOL: Optional[psycopg2.pool.ThreadedConnectionPool] = None
+_POOL_LOCK = threading.Lock()
+
+# Set once refreshing cats_summary has failed, so the failure is reported
+# only once per session instead of after every insert
+_summary_refresh_disabled = False
+
+def get_connection_pool() -> psycopg2.pool.ThreadedConnectionPool:
+    """
+    Return the shared connection pool, creating it on first use.
+    
+    Returns:
+        Thread-safe pool of connections to the PostgreSQL database
+    """
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = psycopg2.pool.ThreadedConnectionPool(minconn=1, maxconn=8, **DB_CONFIG)
+        return _POOL
+
+def close_connection_pool() -> bool:
     """
-    Establish connection to PostgreSQL database.
+    Close every connection held by the shared pool.
     
     Returns:
+        True if a pool was open and has been closed, False otherwise
+    """
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            return False
+        _POOL.closeall()
+        _POOL = None
+        return True
+
+@contextmanager
+def connect_to_database() -> Iterator[Optional[psycopg2.extensions.connection]]:
+    """
+    Borrow a connection to the PostgreSQL database from the shared pool.
+    
+    The connection is handed back to the pool, not closed, when the
+    with-block exits.
+    
+    Yields:
         Database connection object or None if connection fails
     """
     try:
-        connection = psycopg2.connect(**DB_CONFIG)
-        print("✅ Successfully connected to PostgreSQL database!")
-        return connection
+        pool = get_connection_pool()
+        connection = pool.getconn()
     except psycopg2.Error as e:
         print(f"❌ Error connecting to PostgreSQL database: {e}")
-        return None
+        yield None
+        return
+    
+    print("✅ Successfully connected to PostgreSQL database!")
+    try:
+        yield connection
+    finally:
+        pool.putconn(connection)
 
-def insert_single_cat(cursor: psycopg2.extensions.cursor, cat_data: Dict[str, Any]) -> bool:
+@contextmanager
+def autocommit(connection: psycopg2.extensions.connection) -> Iterator[None]:
+    """
+    Run the with-block with autocommit enabled.
+    
+    Each statement then commits on its own, so a single insert costs one
+    round-trip instead of three (BEGIN, INSERT, COMMIT). The connection
+    must not be inside a transaction when the block is entered.
+    
+    Args:
+        connection: Database connection object
+    """
+    connection.autocommit = True
+    try:
+        yield
+    finally:
+        connection.autocommit = False
+
+def prepare_statements(cursor: psycopg2.extensions.cursor) -> None:
+    """
+    Prepare the server-side statements used by this session.
+    
+    Must be called after connecting; the INSERT is then parsed and
+    planned only once instead of on every insert_single_cat call. Prepared
+    statements live as long as the session, so a pooled connection that
+    was prepared by an earlier borrower already has them; that is not an
+    error.
+    
+    Args:
+        cursor: Database cursor object
+    """
+    try:
+        cursor.execute(_PREPARE_INSERT_CAT)
+    except psycopg2.errors.DuplicatePreparedStatement:
+        cursor.connection.rollback()
+
+def insert_single_cat(cursor: psycopg2.extensions.cursor, cat_data: Dict[str, Any],
+                      verbose: bool = False) -> bool:
     """
     Insert a single cat record into the database.
     
+    Uses the ins_cat statement created by prepare_statements().
+    
     Args:
         cursor: Database cursor object
         cat_data: Dictionary containing cat information
+        verbose: Print a line for the inserted cat
         
     Returns:
         True if insertion successful, False otherwise
     """
     try:
-        insert_query = """
-            INSERT INTO cats (name, breed, age, color, weight_kg, is_indoor, adoption_date, description)
-            VALUES (%(name)s, %(breed)s, %(age)s, %(color)s, %(weight_kg)s, %(is_indoor)s, %(adoption_date)s, %(description)s)
-            RETURNING id;
-        """
-        
-        cursor.execute(insert_query, cat_data)
+        cursor.execute(_EXECUTE_INSERT_CAT, cat_data)
         cat_id = cursor.fetchone()[0]
-        print(f"✅ Successfully inserted cat '{cat_data['name']}' with ID: {cat_id}")
+        if verbose:
+            print(f"✅ Successfully inserted cat '{cat_data['name']}' with ID: {cat_id}")
         return True
         
     except psycopg2.Error as e:
         print(f"❌ Error inserting cat '{cat_data.get('name', 'Unknown')}': {e}")
         return False
 
-def insert_multiple_cats(cursor: psycopg2.extensions.cursor, cats_data: List[Dict[str, Any]]) -> int:
+def insert_multiple_cats(cursor: psycopg2.extensions.cursor, cats_data: List[Dict[str, Any]],
+                         fetch_ids: bool = False, verbose: bool = False) -> int:
     """
     Insert multiple cat records into the database.
     
+    All rows are sent through execute_values, which folds up to page_size
+    rows into a single INSERT statement instead of one round-trip per cat.
+    
     Args:
         cursor: Database cursor object
         cats_data: List of dictionaries containing cat information
+        fetch_ids: Add RETURNING id to get back the IDs of the new rows
+        verbose: Print a summary line with the range of inserted IDs
         
     Returns:
         Number of successfully inserted records
     """
-    success_count = 0
+    rows = list(map(CAT_ROW, cats_data))
     
-    for cat_data in cats_data:
-        if insert_single_cat(cursor, cat_data):
-            success_count += 1
+    insert_query = _INSERT_CATS_RETURNING_ID if fetch_ids else _INSERT_CATS
     
-    return success_count
+    try:
+        inserted_ids = psycopg2.extras.execute_values(
+            cursor, insert_query, rows, page_size=1000, fetch=fetch_ids
+        )
+    except psycopg2.Error as e:
+        print(f"❌ Error inserting cats: {e}")
+        return 0
+    
+    if not fetch_ids:
+        # Any failing row raises above, so reaching here means every row went in
+        return len(rows)
+    
+    if verbose and inserted_ids:
+        print(f"✅ Inserted {len(inserted_ids)} cats with IDs {inserted_ids[0][0]}-{inserted_ids[-1][0]}")
+    
+    return len(inserted_ids)
+
+@lru_cache(maxsize=1024)
+def _binary_text(value: Optional[str]) -> bytes:
+    """Encode a text/varchar value as a binary COPY field."""
+    if value is None:
+        return _PG_NULL_FIELD
+    data = value.encode('utf-8')
+    return struct.pack('!i', len(data)) + data
+
+@lru_cache(maxsize=1024)
+def _binary_int4(value: Optional[int]) -> bytes:
+    """Encode an integer value as a binary COPY field."""
+    if value is None:
+        return _PG_NULL_FIELD
+    return struct.pack('!ii', 4, value)
+
+@lru_cache(maxsize=1024)
+def _binary_numeric_2dp(value: Optional[float]) -> bytes:
+    """
+    Encode a value for a NUMERIC(p, 2) column (|value| < 10000) as a
+    binary COPY field: ndigits, weight, sign and dscale followed by
+    base-10000 digits for the integer and fractional parts.
+    """
+    if value is None:
+        return _PG_NULL_FIELD
+    cents = round(value * 100)
+    sign = 0x4000 if cents < 0 else 0x0000
+    whole, fraction = divmod(abs(cents), 100)
+    return struct.pack('!ihhHhhh', 12, 2, 0, sign, 2, whole, fraction * 100)
+
+@lru_cache(maxsize=1024)
+def _binary_bool(value: Optional[bool]) -> bytes:
+    """Encode a boolean value as a binary COPY field."""
+    if value is None:
+        return _PG_NULL_FIELD
+    return struct.pack('!i?', 1, value)
+
+@lru_cache(maxsize=1024)
+def _binary_date(value: Optional[date]) -> bytes:
+    """Encode a date as a binary COPY field (days since 2000-01-01)."""
+    if value is None:
+        return _PG_NULL_FIELD
+    return struct.pack('!ii', 4, (value - _PG_EPOCH).days)
+
+def _as_list(values: Sequence[Any]) -> List[Any]:
+    """Return a column as a list of plain Python values."""
+    return values.tolist() if isinstance(values, np.ndarray) else list(values)
+
+def copy_cats(cursor: psycopg2.extensions.cursor, cat_columns: Dict[str, Sequence[Any]]) -> int:
+    """
+    Bulk-load cat records with binary COPY FROM STDIN.
+    
+    Faster than INSERT for large batches, but no IDs are returned. Values
+    are sent in PostgreSQL's binary format, so numbers, booleans and dates
+    are never formatted as text. Rows are streamed in chunks of
+    COPY_CHUNK_SIZE to cap memory usage.
+    
+    Args:
+        cursor: Database cursor object
+        cat_columns: Cat data as one sequence per column, as returned by
+            generate_random_cats()
+        
+    Returns:
+        Number of successfully copied records
+    """
+    # Encoder for each column, in the order of _COPY_CATS_BINARY
+    encoders = (
+        ('name', _binary_text),
+        ('breed', _binary_text),
+        ('age', _binary_int4),
+        ('color', _binary_text),
+        ('weight_kg', _binary_numeric_2dp),
+        ('is_indoor', _binary_bool),
+        ('adoption_date', _binary_date),
+        ('description', _binary_text)
+    )
+    count = len(cat_columns['name'])
+    
+    try:
+        for start in range(0, count, COPY_CHUNK_SIZE):
+            stop = start + COPY_CHUNK_SIZE
+            fields = [
+                map(encode, _as_list(cat_columns[key][start:stop]))
+                for key, encode in encoders
+            ]
+            buffer = io.BytesIO()
+            buffer.write(_PGCOPY_HEADER)
+            for row in zip(*fields):
+                buffer.write(_PGCOPY_ROW_START)
+                buffer.write(b"".join(row))
+            buffer.write(_PGCOPY_TRAILER)
+            buffer.seek(0)
+            cursor.copy_expert(_COPY_CATS_BINARY, buffer)
+    except psycopg2.Error as e:
+        print(f"❌ Error copying cats: {e}")
+        return 0
+    
+    return count
+
+def refresh_cats_summary(cursor: psycopg2.extensions.cursor) -> None:
+    """
+    Refresh the cats_summary materialized view read by retrieve-data-db.py.
+    
+    Call after a bulk insert has been committed. The refresh re-aggregates
+    the whole cats table, so it is not run for single interactive inserts.
+    CONCURRENTLY keeps the view readable while it is rebuilt. Whenever the
+    view is out of date, retrieve-data-db.py notices that its total differs
+    from the live row count and computes the summary from cats instead.
+    
+    REFRESH requires ownership of the view. If it fails (e.g. the role does
+    not own it) a warning is printed once and no further refreshes are
+    attempted this session.
+    
+    Args:
+        cursor: Database cursor object
+    """
+    global _summary_refresh_disabled
+    if _summary_refresh_disabled:
+        return
+    
+    try:
+        cursor.execute(_REFRESH_CATS_SUMMARY)
+        cursor.connection.commit()
+    except psycopg2.errors.UndefinedTable:
+        # The view is created by create-data.sql or retrieve-data-db.py
+        cursor.connection.rollback()
+        _summary_refresh_disabled = True
+    except psycopg2.Error as e:
+        cursor.connection.rollback()
+        _summary_refresh_disabled = True
+        print(f"⚠️ Could not refresh cats summary: {e}")
+        print("⚠️ Summary statistics will be computed from the cats table until the "
+              "view owner runs REFRESH MATERIALIZED VIEW cats_summary.")
 
 def get_user_input_for_cat() -> Dict[str, Any]:
     """
@@ -109,32 +441,35 @@ def get_user_input_for_cat() -> Dict[str, Any]:
     
     # Age validation
     while True:
-        try:
-            age_input = input("Age (years): ").strip()
-            cat_data['age'] = int(age_input) if age_input else None
-            if cat_data['age'] is not None and (cat_data['age'] < 0 or cat_data['age'] > 30):
-                print("❌ Age must be between 0 and 30 years")
-                continue
+        age_input = input("Age (years): ").strip()
+        if not age_input:
+            cat_data['age'] = None
             break
-        except ValueError:
+        if not INT_RE.match(age_input):
             print("❌ Please enter a valid number for age")
+            continue
+        cat_data['age'] = int(age_input)
+        if cat_data['age'] < 0 or cat_data['age'] > 30:
+            print("❌ Age must be between 0 and 30 years")
+            continue
+        break
     
     cat_data['color'] = input("Color: ").strip() or None
     
     # Weight validation
     while True:
-        try:
-            weight_input = input("Weight (kg): ").strip()
-            if weight_input:
-                cat_data['weight_kg'] = float(weight_input)
-                if cat_data['weight_kg'] < 0 or cat_data['weight_kg'] > 20:
-                    print("❌ Weight must be between 0 and 20 kg")
-                    continue
-            else:
-                cat_data['weight_kg'] = None
+        weight_input = input("Weight (kg): ").strip()
+        if not weight_input:
+            cat_data['weight_kg'] = None
             break
-        except ValueError:
+        if not FLOAT_RE.match(weight_input):
             print("❌ Please enter a valid number for weight")
+            continue
+        cat_data['weight_kg'] = float(weight_input)
+        if cat_data['weight_kg'] < 0 or cat_data['weight_kg'] > 20:
+            print("❌ Weight must be between 0 and 20 kg")
+            continue
+        break
     
     # Indoor/Outdoor
     while True:
@@ -157,72 +492,66 @@ def get_user_input_for_cat() -> Dict[str, Any]:
         if not date_input:
             cat_data['adoption_date'] = date.today()
             break
-        try:
-            cat_data['adoption_date'] = datetime.strptime(date_input, '%Y-%m-%d').date()
-            break
-        except ValueError:
-            print("❌ Please enter date in YYYY-MM-DD format")
+        if DATE_RE.match(date_input):
+            try:
+                cat_data['adoption_date'] = datetime.strptime(date_input, '%Y-%m-%d').date()
+                break
+            except ValueError:
+                # Right shape but not a real date, e.g. 2024-02-30
+                pass
+        print("❌ Please enter date in YYYY-MM-DD format")
     
     cat_data['description'] = input("Description: ").strip() or None
     
     return cat_data
 
-def generate_random_cats(count: int) -> List[Dict[str, Any]]:
+def generate_random_cats(count: int) -> Dict[str, Sequence[Any]]:
     """
     Generate random cat data for testing purposes.
     
+    The data is returned column-wise (one sequence per field) so it can be
+    handed to copy_cats() without building a dictionary per cat.
+    
     Args:
         count: Number of random cats to generate
         
+    Returns:
+        Mapping of column name to a sequence of ``count`` values
+    """
+    rng = np.random.default_rng()
+    # Evaluated once so every cat in the batch shares the same adoption date
+    today = date.today()
+    
+    def pick(values: np.ndarray) -> np.ndarray:
+        return values[rng.integers(0, values.size, size=count)]
+    
+    return {
+        'name': pick(_CAT_NAMES),
+        'breed': pick(_CAT_BREEDS),
+        'age': rng.integers(1, 16, size=count),
+        'color': pick(_CAT_COLORS),
+        'weight_kg': np.round(rng.uniform(2.5, 8.0, size=count), 2),
+        'is_indoor': rng.integers(0, 2, size=count, dtype=bool),
+        'adoption_date': [today] * count,
+        'description': pick(_CAT_DESCRIPTIONS)
+    }
+
+def cats_from_columns(cat_columns: Dict[str, Sequence[Any]], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Convert column-wise cat data into a list of cat data dictionaries.
+    
+    Args:
+        cat_columns: Cat data as one sequence per column
+        limit: Only convert the first ``limit`` cats
+        
     Returns:
         List of cat data dictionaries
     """
-    cat_names = [
-        "Fluffy", "Oreo", "Felix", "Bella", "Max", "Lucy", "Charlie", "Molly",
-        "Oscar", "Ruby", "Leo", "Daisy", "Milo", "Sophie", "Simba", "Chloe",
-        "Jasper", "Lily", "Oliver", "Zoe", "Chester", "Maya", "Toby", "Emma"
-    ]
-    
-    cat_breeds = [
-        "Persian", "Siamese", "Maine Coon", "British Shorthair", "Ragdoll",
-        "Bengal", "Russian Blue", "Scottish Fold", "Abyssinian", "Birman",
-        "Norwegian Forest Cat", "Oriental", "Burmese", "Egyptian Mau", "Manx"
-    ]
-    
-    cat_colors = [
-        "Black", "White", "Gray", "Orange", "Brown", "Cream", "Silver",
-        "Calico", "Tabby", "Tortoiseshell", "Tuxedo", "Blue", "Red"
-    ]
-    
-    descriptions = [
-        "A playful and energetic cat who loves to chase toys",
-        "Calm and gentle, perfect for families with children",
-        "Very affectionate and enjoys being petted",
-        "Independent but loyal, great for apartment living",
-        "Curious and intelligent, loves to explore",
-        "Shy at first but becomes very loving once comfortable",
-        "Active outdoor cat who enjoys climbing trees",
-        "Lazy indoor cat who loves to sleep in sunny spots",
-        "Social cat who gets along well with other pets",
-        "Vocal cat who likes to 'talk' to their owners"
-    ]
-    
-    cats_data = []
-    
-    for i in range(count):
-        cat_data = {
-            'name': random.choice(cat_names),
-            'breed': random.choice(cat_breeds),
-            'age': random.randint(1, 15),
-            'color': random.choice(cat_colors),
-            'weight_kg': round(random.uniform(2.5, 8.0), 2),
-            'is_indoor': random.choice([True, False]),
-            'adoption_date': date.today(),
-            'description': random.choice(descriptions)
-        }
-        cats_data.append(cat_data)
-    
-    return cats_data
+    columns = {
+        key: _as_list(values[:limit])
+        for key, values in cat_columns.items()
+    }
+    return [dict(zip(columns, row)) for row in zip(*columns.values())]
 
 def display_cat_info(cat_data: Dict[str, Any]) -> None:
     """
@@ -250,125 +579,135 @@ def main():
     print("=" * 60)
     
     # Connect to database
-    connection = connect_to_database()
-    if not connection:
-        sys.exit(1)
-    
     try:
-        cursor = connection.cursor()
-        
-        while True:
-            print("\n📋 Choose an option:")
-            print("1. Insert a single cat manually")
-            print("2. Insert multiple cats manually")
-            print("3. Generate and insert random cats")
-            print("4. Exit")
-            
-            choice = input("\nEnter your choice (1-4): ").strip()
+        with connect_to_database() as connection:
+            if not connection:
+                sys.exit(1)
             
-            if choice == '1':
-                try:
-                    cat_data = get_user_input_for_cat()
-                    display_cat_info(cat_data)
-                    
-                    confirm = input("\n❓ Do you want to insert this cat? (y/n): ").strip().lower()
-                    if confirm in ['y', 'yes']:
-                        if insert_single_cat(cursor, cat_data):
-                            connection.commit()
-                            print("✅ Cat data committed to database!")
-                        else:
-                            connection.rollback()
-                            print("❌ Failed to insert cat data. Transaction rolled back.")
-                    else:
-                        print("❌ Cat insertion cancelled.")
-                        
-                except ValueError as e:
-                    print(f"❌ Error: {e}")
-                except KeyboardInterrupt:
-                    print("\n❌ Operation cancelled by user.")
-            
-            elif choice == '2':
-                try:
-                    count = int(input("How many cats do you want to add? "))
-                    if count <= 0:
-                        print("❌ Number must be greater than 0")
-                        continue
-                    
-                    cats_data = []
-                    for i in range(count):
-                        print(f"\n--- Cat {i + 1} of {count} ---")
-                        cat_data = get_user_input_for_cat()
-                        cats_data.append(cat_data)
-                    
-                    print(f"\n📋 Summary: {len(cats_data)} cats ready to insert")
-                    confirm = input("❓ Do you want to insert all cats? (y/n): ").strip().lower()
+            try:
+                cursor = connection.cursor()
+                prepare_statements(cursor)
+                connection.commit()
+                
+                while True:
+                    print("\n📋 Choose an option:")
+                    print("1. Insert a single cat manually")
+                    print("2. Insert multiple cats manually")
+                    print("3. Generate and insert random cats")
+                    print("4. Exit")
                     
-                    if confirm in ['y', 'yes']:
-                        success_count = insert_multiple_cats(cursor, cats_data)
-                        if success_count > 0:
-                            connection.commit()
-                            print(f"✅ Successfully inserted {success_count}/{len(cats_data)} cats!")
-                        else:
-                            connection.rollback()
-                            print("❌ No cats were inserted. Transaction rolled back.")
-                    else:
-                        print("❌ Bulk insertion cancelled.")
-                        
-                except ValueError:
-                    print("❌ Please enter a valid number")
-                except KeyboardInterrupt:
-                    print("\n❌ Operation cancelled by user.")
-            
-            elif choice == '3':
-                try:
-                    count = int(input("How many random cats do you want to generate? "))
-                    if count <= 0:
-                        print("❌ Number must be greater than 0")
-                        continue
+                    choice = input("\nEnter your choice (1-4): ").strip()
                     
-                    cats_data = generate_random_cats(count)
-                    print(f"\n📋 Generated {len(cats_data)} random cats")
+                    if choice == '1':
+                        try:
+                            cat_data = get_user_input_for_cat()
+                            display_cat_info(cat_data)
+                            
+                            confirm = input("\n❓ Do you want to insert this cat? (y/n): ").strip().lower()
+                            if confirm in ['y', 'yes']:
+                                with autocommit(connection):
+                                    inserted = insert_single_cat(cursor, cat_data, verbose=True)
+                                if inserted:
+                                    print("✅ Cat data committed to database!")
+                                else:
+                                    print("❌ Failed to insert cat data. Transaction rolled back.")
+                            else:
+                                print("❌ Cat insertion cancelled.")
+                                
+                        except ValueError as e:
+                            print(f"❌ Error: {e}")
+                        except KeyboardInterrupt:
+                            print("\n❌ Operation cancelled by user.")
                     
-                    # Show first few cats as preview
-                    print("\n🔍 Preview (first 3 cats):")
-                    for i, cat_data in enumerate(cats_data[:3]):
-                        print(f"\nCat {i + 1}:")
-                        display_cat_info(cat_data)
+                    elif choice == '2':
+                        try:
+                            count = int(input("How many cats do you want to add? "))
+                            if count <= 0:
+                                print("❌ Number must be greater than 0")
+                                continue
+                            
+                            cats_data = []
+                            for i in range(count):
+                                print(f"\n--- Cat {i + 1} of {count} ---")
+                                cat_data = get_user_input_for_cat()
+                                cats_data.append(cat_data)
+                            
+                            print(f"\n📋 Summary: {len(cats_data)} cats ready to insert")
+                            confirm = input("❓ Do you want to insert all cats? (y/n): ").strip().lower()
+                            
+                            if confirm in ['y', 'yes']:
+                                success_count = insert_multiple_cats(cursor, cats_data)
+                                if success_count > 0:
+                                    connection.commit()
+                                    print(f"✅ Successfully inserted {success_count}/{len(cats_data)} cats!")
+                                    refresh_cats_summary(cursor)
+                                else:
+                                    connection.rollback()
+                                    print("❌ No cats were inserted. Transaction rolled back.")
+                            else:
+                                print("❌ Bulk insertion cancelled.")
+                                
+                        except ValueError:
+                            print("❌ Please enter a valid number")
+                        except KeyboardInterrupt:
+                            print("\n❌ Operation cancelled by user.")
                     
-                    if len(cats_data) > 3:
-                        print(f"\n... and {len(cats_data) - 3} more cats")
+                    elif choice == '3':
+                        try:
+                            count = int(input("How many random cats do you want to generate? "))
+                            if count <= 0:
+                                print("❌ Number must be greater than 0")
+                                continue
+                            
+                            cat_columns = generate_random_cats(count)
+                            print(f"\n📋 Generated {count} random cats")
+                            
+                            # Show first few cats as preview
+                            print("\n🔍 Preview (first 3 cats):")
+                            for i, cat_data in enumerate(cats_from_columns(cat_columns, limit=3)):
+                                print(f"\nCat {i + 1}:")
+                                display_cat_info(cat_data)
+                            
+                            if count > 3:
+                                print(f"\n... and {count - 3} more cats")
+                            
+                            confirm = input(f"\n❓ Do you want to insert all {count} random cats? (y/n): ").strip().lower()
+                            
+                            if confirm in ['y', 'yes']:
+                                show_ids = input("❓ Show the IDs of the inserted cats? (y/n): ").strip().lower()
+                                if show_ids in ['y', 'yes']:
+                                    success_count = insert_multiple_cats(
+                                        cursor, cats_from_columns(cat_columns), fetch_ids=True, verbose=True
+                                    )
+                                else:
+                                    success_count = copy_cats(cursor, cat_columns)
+                                if success_count > 0:
+                                    connection.commit()
+                                    print(f"✅ Successfully inserted {success_count}/{count} random cats!")
+                                    refresh_cats_summary(cursor)
+                                else:
+                                    connection.rollback()
+                                    print("❌ No cats were inserted. Transaction rolled back.")
+                            else:
+                                print("❌ Random cat insertion cancelled.")
+                                
+                        except ValueError:
+                            print("❌ Please enter a valid number")
                     
-                    confirm = input(f"\n❓ Do you want to insert all {len(cats_data)} random cats? (y/n): ").strip().lower()
+                    elif choice == '4':
+                        print("👋 Goodbye!")
+                        break
                     
-                    if confirm in ['y', 'yes']:
-                        success_count = insert_multiple_cats(cursor, cats_data)
-                        if success_count > 0:
-                            connection.commit()
-                            print(f"✅ Successfully inserted {success_count}/{len(cats_data)} random cats!")
-                        else:
-                            connection.rollback()
-                            print("❌ No cats were inserted. Transaction rolled back.")
                     else:
-                        print("❌ Random cat insertion cancelled.")
-                        
-                except ValueError:
-                    print("❌ Please enter a valid number")
-            
-            elif choice == '4':
-                print("👋 Goodbye!")
-                break
-            
-            else:
-                print("❌ Invalid choice. Please enter 1, 2, 3, or 4.")
-        
-        cursor.close()
-        
-    except Exception as e:
-        print(f"❌ An unexpected error occurred: {e}")
-        connection.rollback()
+                        print("❌ Invalid choice. Please enter 1, 2, 3, or 4.")
+                
+                cursor.close()
+                
+            except Exception as e:
+                print(f"❌ An unexpected error occurred: {e}")
+                connection.rollback()
     finally:
-        if connection:
-            connection.close()
+        if close_connection_pool():
             print("\n✅ Database connection closed.")
 
 if __name__ == "__main__":
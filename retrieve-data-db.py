@@ -4,210 +4,358 @@ Python script to connect to the local PostgreSQL database and display cats data.
 """
 
 import psycopg2
+import psycopg2.errors
+import psycopg2.pool
 from psycopg2 import sql
 import sys
 import os
-from typing import List, Tuple, Optional
+import threading
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import List, Tuple, Optional, Iterator, Any, Mapping, Final
 
-# Load environment variables from .env file if python-dotenv is available
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    print("📝 Note: python-dotenv not installed. Using system environment variables only.")
+# Load environment variables from .env file if python-dotenv is available,
+# unless every setting read below is already in the environment (load_dotenv
+# never overrides variables that are already set)
+if not {'DB_HOST', 'DB_PORT', 'POSTGRES_DB', 'POSTGRES_USER', 'POSTGRES_PASSWORD'} <= os.environ.keys():
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        print("📝 Note: python-dotenv not installed. Using system environment variables only.")
 
-# Database connection parameters from environment variables
-DB_CONFIG = {
+# Database connection parameters from environment variables, frozen at import
+DB_CONFIG: Final[Mapping[str, Any]] = MappingProxyType({
     'host': os.getenv('DB_HOST', 'localhost'),
     'port': int(os.getenv('DB_PORT', '5432')),
     'database': os.getenv('POSTGRES_DB', 'catsdb'),
     'user': os.getenv('POSTGRES_USER', 'postgres'),
     'password': os.getenv('POSTGRES_PASSWORD', 'password')
-}
+})
+
+# SQL statements, built once at import and reused on every call
+_SELECT_TABLE_OVERVIEW = sql.SQL("""
+    SELECT
+        (SELECT jsonb_agg(jsonb_build_array(column_name, data_type, is_nullable, column_default)
+                          ORDER BY ordinal_position)
+         FROM information_schema.columns
+         WHERE table_schema = 'public'
+         AND table_name = 'cats'),
+        (SELECT COUNT(*) FROM cats);
+""")
+
+_SELECT_ALL_CATS = sql.SQL("""
+    SELECT id, name, breed, age, color, weight_kg, is_indoor, 
+           adoption_date, description
+    FROM cats 
+    ORDER BY id;
+""")
+
+_SELECT_CATS_SUMMARY = sql.SQL("""
+    WITH breed_stats AS (
+        SELECT breed, SUM(count) AS count
+        FROM cats_summary
+        GROUP BY breed
+    ),
+    indoor_stats AS (
+        SELECT is_indoor, SUM(count) AS count
+        FROM cats_summary
+        GROUP BY is_indoor
+    )
+    SELECT
+        (SELECT jsonb_agg(jsonb_build_array(breed, count) ORDER BY count DESC) FROM breed_stats),
+        (SELECT jsonb_build_array(SUM(age_sum) / NULLIF(SUM(age_count), 0), MIN(min_age), MAX(max_age))
+         FROM cats_summary),
+        (SELECT jsonb_agg(jsonb_build_array(is_indoor, count)) FROM indoor_stats),
+        (SELECT COALESCE(SUM(count), 0) FROM cats_summary);
+""")
+
+# Same statistics computed directly from cats, for databases without the view
+_SELECT_CATS_SUMMARY_LIVE = sql.SQL("""
+    WITH breed_stats AS (
+        SELECT breed, COUNT(*) AS count
+        FROM cats
+        GROUP BY breed
+    ),
+    age_stats AS (
+        SELECT
+            AVG(age) AS avg_age,
+            MIN(age) AS min_age,
+            MAX(age) AS max_age
+        FROM cats
+    ),
+    indoor_stats AS (
+        SELECT is_indoor, COUNT(*) AS count
+        FROM cats
+        GROUP BY is_indoor
+    )
+    SELECT
+        (SELECT jsonb_agg(jsonb_build_array(breed, count) ORDER BY count DESC) FROM breed_stats),
+        (SELECT jsonb_build_array(avg_age, min_age, max_age) FROM age_stats),
+        (SELECT jsonb_agg(jsonb_build_array(is_indoor, count)) FROM indoor_stats);
+""")
+
+_CREATE_CATS_SUMMARY_VIEW = sql.SQL("""
+    CREATE MATERIALIZED VIEW IF NOT EXISTS cats_summary AS
+    SELECT
+        breed,
+        is_indoor,
+        COUNT(*) AS count,
+        COUNT(age) AS age_count,
+        SUM(age) AS age_sum,
+        MIN(age) AS min_age,
+        MAX(age) AS max_age
+    FROM cats
+    GROUP BY breed, is_indoor;
+    CREATE UNIQUE INDEX IF NOT EXISTS cats_summary_breed_indoor ON cats_summary (breed, is_indoor);
+""")
 
-def connect_to_database() -> Optional[psycopg2.extensions.connection]:
+_CREATE_BREED_SEARCH_INDEX = sql.SQL("""
+    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+    CREATE INDEX IF NOT EXISTS cats_breed_trgm ON cats USING gin (breed gin_trgm_ops);
+""")
+
+_SEARCH_CATS_BY_BREED = sql.SQL("""
+    SELECT name, age, color, is_indoor
+    FROM cats 
+    WHERE breed ILIKE %s
+    ORDER BY name;
+""")
+
+# Shared connection pool, created on first use so importing this module
+# does not require a reachable database
+_POOL: Optional[psycopg2.pool.ThreadedConnectionPool] = None
+_POOL_LOCK = threading.Lock()
+
+def get_connection_pool() -> psycopg2.pool.ThreadedConnectionPool:
     """
-    Establish connection to PostgreSQL database.
+    Return the shared connection pool, creating it on first use.
     
     Returns:
-        Database connection object or None if connection fails
+        Thread-safe pool of connections to the PostgreSQL database
     """
-    try:
-        connection = psycopg2.connect(**DB_CONFIG)
-        print("✅ Successfully connected to PostgreSQL database!")
-        return connection
-    except psycopg2.Error as e:
-        print(f"❌ Error connecting to PostgreSQL database: {e}")
-        return None
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = psycopg2.pool.ThreadedConnectionPool(minconn=1, maxconn=8, **DB_CONFIG)
+        return _POOL
 
-def check_table_exists(cursor: psycopg2.extensions.cursor) -> bool:
+def close_connection_pool() -> bool:
     """
-    Check if the cats table exists in the database.
+    Close every connection held by the shared pool.
     
-    Args:
-        cursor: Database cursor object
-        
     Returns:
-        True if table exists, False otherwise
+        True if a pool was open and has been closed, False otherwise
     """
-    try:
-        cursor.execute("""
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables 
-                WHERE table_schema = 'public' 
-                AND table_name = 'cats'
-            );
-        """)
-        return cursor.fetchone()[0]
-    except psycopg2.Error as e:
-        print(f"❌ Error checking table existence: {e}")
-        return False
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            return False
+        _POOL.closeall()
+        _POOL = None
+        return True
 
-def get_table_info(cursor: psycopg2.extensions.cursor) -> None:
+@contextmanager
+def connect_to_database() -> Iterator[Optional[psycopg2.extensions.connection]]:
     """
-    Display information about the cats table structure.
+    Borrow a connection to the PostgreSQL database from the shared pool.
     
-    Args:
-        cursor: Database cursor object
+    The connection is handed back to the pool, not closed, when the
+    with-block exits.
+    
+    Yields:
+        Database connection object or None if connection fails
     """
     try:
-        cursor.execute("""
-            SELECT column_name, data_type, is_nullable, column_default
-            FROM information_schema.columns
-            WHERE table_name = 'cats'
-            ORDER BY ordinal_position;
-        """)
-        
-        columns = cursor.fetchall()
-        print("\n📋 Table Structure:")
-        print("-" * 80)
-        print(f"{'Column Name':<20} {'Data Type':<20} {'Nullable':<10} {'Default':<20}")
-        print("-" * 80)
-        
-        for column in columns:
-            col_name, data_type, nullable, default = column
-            default_str = str(default) if default else "None"
-            print(f"{col_name:<20} {data_type:<20} {nullable:<10} {default_str:<20}")
-            
+        pool = get_connection_pool()
+        connection = pool.getconn()
     except psycopg2.Error as e:
-        print(f"❌ Error getting table info: {e}")
+        print(f"❌ Error connecting to PostgreSQL database: {e}")
+        yield None
+        return
+    
+    print("✅ Successfully connected to PostgreSQL database!")
+    try:
+        yield connection
+    finally:
+        pool.putconn(connection)
 
-def get_cats_count(cursor: psycopg2.extensions.cursor) -> int:
+def get_table_overview(cursor: psycopg2.extensions.cursor) -> Optional[Tuple[List[List[Any]], int]]:
     """
-    Get the total number of cats in the database.
+    Fetch the cats table structure and row count in a single query.
     
     Args:
         cursor: Database cursor object
         
     Returns:
-        Number of cats in the database
+        Tuple of (columns, count) where each column is
+        [name, data type, nullable, default], or None if the table
+        does not exist
     """
     try:
-        cursor.execute("SELECT COUNT(*) FROM cats;")
-        count = cursor.fetchone()[0]
-        print(f"\n📊 Total number of cats in database: {count}")
-        return count
+        cursor.execute(_SELECT_TABLE_OVERVIEW)
+        columns, count = cursor.fetchone()
+        return columns, count
+    except psycopg2.errors.UndefinedTable:
+        cursor.connection.rollback()
+        return None
     except psycopg2.Error as e:
-        print(f"❌ Error getting cats count: {e}")
-        return 0
+        print(f"❌ Error checking cats table: {e}")
+        cursor.connection.rollback()
+        return None
+
+def get_table_info(columns: List[List[Any]]) -> None:
+    """
+    Display information about the cats table structure.
+    
+    Args:
+        columns: Column descriptions as returned by get_table_overview()
+    """
+    print("\n📋 Table Structure:")
+    print("-" * 80)
+    print(f"{'Column Name':<20} {'Data Type':<20} {'Nullable':<10} {'Default':<20}")
+    print("-" * 80)
+    
+    for column in columns:
+        col_name, data_type, nullable, default = column
+        default_str = str(default) if default else "None"
+        print(f"{col_name:<20} {data_type:<20} {nullable:<10} {default_str:<20}")
 
 def display_all_cats(cursor: psycopg2.extensions.cursor) -> None:
     """
     Display all cats data in a formatted table.
     
+    Rows are streamed through a server-side (named) cursor, so only
+    itersize rows are held in memory at a time.
+    
     Args:
         cursor: Database cursor object
     """
     try:
-        cursor.execute("""
-            SELECT id, name, breed, age, color, weight_kg, is_indoor, 
-                   adoption_date, description
-            FROM cats 
-            ORDER BY id;
-        """)
-        
-        cats = cursor.fetchall()
-        
-        if not cats:
-            print("\n❌ No cats found in the database.")
-            return
+        with cursor.connection.cursor(name='cats_stream') as stream:
+            stream.itersize = 1000
+            stream.execute(_SELECT_ALL_CATS)
             
-        print("\n🐱 All Cats Data:")
-        print("=" * 120)
+            write = sys.stdout.write
+            separator = "-" * 120
+            found = False
+            for cat in stream:
+                if not found:
+                    print("\n🐱 All Cats Data:")
+                    print("=" * 120)
+                    found = True
+                
+                cat_id, name, breed, age, color, weight, is_indoor, adoption_date, description = cat
+                indoor_status = "Indoor" if is_indoor else "Outdoor"
+                
+                # One write per cat instead of one print per field
+                write(
+                    f"ID: {cat_id}\n"
+                    f"Name: {name}\n"
+                    f"Breed: {breed}\n"
+                    f"Age: {age} years\n"
+                    f"Color: {color}\n"
+                    f"Weight: {weight} kg\n"
+                    f"Status: {indoor_status}\n"
+                    f"Adoption Date: {adoption_date}\n"
+                    f"Description: {description}\n"
+                    f"{separator}\n"
+                )
         
-        for cat in cats:
-            cat_id, name, breed, age, color, weight, is_indoor, adoption_date, description = cat
-            indoor_status = "Indoor" if is_indoor else "Outdoor"
-            
-            print(f"ID: {cat_id}")
-            print(f"Name: {name}")
-            print(f"Breed: {breed}")
-            print(f"Age: {age} years")
-            print(f"Color: {color}")
-            print(f"Weight: {weight} kg")
-            print(f"Status: {indoor_status}")
-            print(f"Adoption Date: {adoption_date}")
-            print(f"Description: {description}")
-            print("-" * 120)
+        if not found:
+            print("\n❌ No cats found in the database.")
             
     except psycopg2.Error as e:
         print(f"❌ Error displaying cats data: {e}")
 
-def display_cats_summary(cursor: psycopg2.extensions.cursor) -> None:
+def display_cats_summary(cursor: psycopg2.extensions.cursor, count: int) -> None:
     """
     Display summary statistics about the cats.
     
+    The statistics are read from the cats_summary materialized view, which
+    holds one row per breed and indoor status, instead of scanning cats.
+    If the view does not exist (e.g. the role may not create it) or is
+    stale, i.e. its total differs from the live row count, they are
+    computed from the cats table instead.
+    
     Args:
         cursor: Database cursor object
+        count: Current number of rows in cats, as returned by get_table_overview()
     """
     try:
-        # Breed statistics
-        cursor.execute("""
-            SELECT breed, COUNT(*) as count
-            FROM cats 
-            GROUP BY breed 
-            ORDER BY count DESC;
-        """)
-        breeds = cursor.fetchall()
+        try:
+            cursor.execute(_SELECT_CATS_SUMMARY)
+            breeds, age_stats, indoor_stats, view_count = cursor.fetchone()
+        except psycopg2.errors.UndefinedTable:
+            cursor.connection.rollback()
+            view_count = None
+        
+        if view_count != count:
+            cursor.execute(_SELECT_CATS_SUMMARY_LIVE)
+            breeds, age_stats, indoor_stats = cursor.fetchone()
         
+        # Breed statistics
         print("\n📈 Cats by Breed:")
         print("-" * 40)
-        for breed, count in breeds:
+        for breed, count in breeds or []:
             print(f"{breed:<25} {count:>3}")
         
         # Age statistics
-        cursor.execute("""
-            SELECT 
-                AVG(age) as avg_age,
-                MIN(age) as min_age,
-                MAX(age) as max_age
-            FROM cats;
-        """)
-        age_stats = cursor.fetchone()
-        
         print(f"\n📊 Age Statistics:")
         print("-" * 30)
-        print(f"Average Age: {age_stats[0]:.1f} years")
+        if age_stats[0] is None:
+            print("Average Age: Unknown")
+        else:
+            print(f"Average Age: {age_stats[0]:.1f} years")
         print(f"Youngest Cat: {age_stats[1]} years")
         print(f"Oldest Cat: {age_stats[2]} years")
         
         # Indoor vs Outdoor
-        cursor.execute("""
-            SELECT is_indoor, COUNT(*) as count
-            FROM cats 
-            GROUP BY is_indoor;
-        """)
-        indoor_stats = cursor.fetchall()
-        
         print(f"\n🏠 Indoor vs Outdoor:")
         print("-" * 25)
-        for is_indoor, count in indoor_stats:
+        for is_indoor, count in indoor_stats or []:
             status = "Indoor" if is_indoor else "Outdoor"
             print(f"{status}: {count}")
             
     except psycopg2.Error as e:
+        cursor.connection.rollback()
         print(f"❌ Error getting summary statistics: {e}")
 
+def ensure_cats_summary_view(cursor: psycopg2.extensions.cursor) -> None:
+    """
+    Create the cats_summary materialized view if it is missing.
+    
+    Databases initialised from an older create-data.sql lack the view.
+    insert_data-db.py refreshes it after every committed bulk insert.
+    
+    Args:
+        cursor: Database cursor object
+    """
+    try:
+        cursor.execute(_CREATE_CATS_SUMMARY_VIEW)
+        cursor.connection.commit()
+    except psycopg2.Error as e:
+        cursor.connection.rollback()
+        print(f"📝 Note: could not create cats summary view, summary will scan the cats table: {e}")
+
+def ensure_breed_search_index(cursor: psycopg2.extensions.cursor) -> None:
+    """
+    Create the trigram index used by search_cats_by_breed() if it is missing.
+    
+    Databases initialised from an older create-data.sql lack the index.
+    Creating it needs the pg_trgm extension; if that is not permitted the
+    search still works, only without the index.
+    
+    Args:
+        cursor: Database cursor object
+    """
+    try:
+        cursor.execute(_CREATE_BREED_SEARCH_INDEX)
+        cursor.connection.commit()
+    except psycopg2.Error as e:
+        cursor.connection.rollback()
+        print(f"📝 Note: could not create breed search index: {e}")
+
 def search_cats_by_breed(cursor: psycopg2.extensions.cursor, breed: str) -> None:
     """
     Search and display cats by breed.
@@ -217,12 +365,7 @@ def search_cats_by_breed(cursor: psycopg2.extensions.cursor, breed: str) -> None
         breed: Breed name to search for
     """
     try:
-        cursor.execute("""
-            SELECT name, age, color, is_indoor
-            FROM cats 
-            WHERE LOWER(breed) LIKE LOWER(%s)
-            ORDER BY name;
-        """, (f"%{breed}%",))
+        cursor.execute(_SEARCH_CATS_BY_BREED, (f"%{breed}%",))
         
         cats = cursor.fetchall()
         
@@ -251,44 +394,49 @@ def main():
     print("=" * 50)
     
     # Connect to database
-    connection = connect_to_database()
-    if not connection:
-        sys.exit(1)
-    
     try:
-        cursor = connection.cursor()
-        
-        # Check if table exists
-        if not check_table_exists(cursor):
-            print("❌ Cats table does not exist in the database!")
-            sys.exit(1)
-        
-        print("✅ Cats table found!")
-        
-        # Display table information
-        get_table_info(cursor)
-        
-        # Get and display count
-        count = get_cats_count(cursor)
-        
-        if count > 0:
-            # Display all cats
-            display_all_cats(cursor)
-            
-            # Display summary statistics
-            display_cats_summary(cursor)
+        with connect_to_database() as connection:
+            if not connection:
+                sys.exit(1)
             
-            # Example search
-            print("\n" + "=" * 50)
-            search_cats_by_breed(cursor, "Maine")
-            
-        cursor.close()
-        
-    except Exception as e:
-        print(f"❌ An error occurred: {e}")
+            try:
+                cursor = connection.cursor()
+                
+                # Check the table and fetch its structure and size in one go
+                overview = get_table_overview(cursor)
+                if overview is None:
+                    print("❌ Cats table does not exist in the database!")
+                    sys.exit(1)
+                
+                columns, count = overview
+                print("✅ Cats table found!")
+                
+                ensure_breed_search_index(cursor)
+                ensure_cats_summary_view(cursor)
+                
+                # Display table information
+                get_table_info(columns)
+                
+                # Display count
+                print(f"\n📊 Total number of cats in database: {count}")
+                
+                if count > 0:
+                    # Display all cats
+                    display_all_cats(cursor)
+                    
+                    # Display summary statistics
+                    display_cats_summary(cursor, count)
+                    
+                    # Example search
+                    print("\n" + "=" * 50)
+                    search_cats_by_breed(cursor, "Maine")
+                    
+                cursor.close()
+                
+            except Exception as e:
+                print(f"❌ An error occurred: {e}")
     finally:
-        if connection:
-            connection.close()
+        if close_connection_pool():
             print("\n✅ Database connection closed.")
 
 if __name__ == "__main__":
@@ -84,7 +84,7 @@ def check_requirements():
     """Check if required Python packages are installed."""
     print("\n🔍 Checking Python requirements...")
     
-    required_packages = ['psycopg2', 'dotenv']
+    required_packages = ['psycopg2', 'dotenv', 'numpy']
     missing_packages = []
     
     for package in required_packages:
@@ -93,6 +93,8 @@ def check_requirements():
                 import psycopg2
             elif package == 'dotenv':
                 import dotenv
+            elif package == 'numpy':
+                import numpy
             print(f"✅ {package} is installed")
         except ImportError:
             print(f"❌ {package} is not installed")